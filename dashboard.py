@@ -4,7 +4,7 @@ import asyncio
 import time
 import math
 import numpy as np
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 from sqlalchemy import select, desc, func
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
@@ -19,37 +19,49 @@ KYIV_TZ = ZoneInfo("Europe/Kyiv")
 st.set_page_config(page_title="AutoRia Моніторинг", layout="wide")
 st.title("🚗 AutoRia: Моніторинг у реальному часі")
 
-engine = create_async_engine(
-    settings.DATABASE_URL_asyncpg,
-    poolclass=NullPool,
-    echo=False,
-    isolation_level="AUTOCOMMIT"
-)
-local_session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+@st.cache_resource
+def get_session_factory():
+    engine = create_async_engine(
+        settings.DATABASE_URL_asyncpg,
+        poolclass=NullPool,
+        echo=False,
+        isolation_level="AUTOCOMMIT"
+    )
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+local_session_factory = get_session_factory()
 
 
 # --- ФУНКЦІЇ ЗАПИТІВ ---
-async def get_total_count():
+def filter_recent(query, since):
+    if since is None:
+        return query
+    return query.where(Car.datetime_found >= since)
+
+
+async def get_total_count(since):
     async with local_session_factory() as session:
-        query = select(func.count(Car.id))
+        query = filter_recent(select(func.count(Car.id)), since)
         result = await session.execute(query)
         return result.scalar()
 
 
-async def get_chart_data():
+async def get_chart_data(since):
     async with local_session_factory() as session:
-        query = select(Car.price_usd,
-                       Car.odometer,
-                       Car.title,
-                       Car.datetime_found)
+        query = filter_recent(select(Car.price_usd,
+                                     Car.odometer,
+                                     Car.title,
+                                     Car.datetime_found), since)
         result = await session.execute(query)
         return result.all()
 
 
-async def get_table_page(offset_val, limit_val):
+async def get_table_page(offset_val, limit_val, since):
     async with local_session_factory() as session:
-        query = select(Car).order_by(
-            desc(Car.id)
+        query = filter_recent(select(Car), since).order_by(
+            desc(Car.datetime_found), desc(Car.id)
         ).offset(offset_val).limit(limit_val)
         result = await session.execute(query)
         cars = result.scalars().all()
@@ -67,8 +79,42 @@ def run_sync(coroutine):
 # --- САЙДБАР: НАЛАШТУВАННЯ ТА ПАГІНАЦІЯ ---
 st.sidebar.header("Налаштування")
 
+period_options = {
+    "1 місяць": 1,
+    "3 місяці": 3,
+    "6 місяців": 6,
+    "12 місяців": 12,
+    "Весь час": None,
+}
+period_labels = list(period_options.keys())
+default_period = next(
+    (label for label, months in period_options.items()
+     if months == settings.DASHBOARD_DEFAULT_MONTHS),
+    None
+)
+if default_period is None:
+    default_period = period_labels[1]
+    st.sidebar.warning(
+        f"DASHBOARD_DEFAULT_MONTHS={settings.DASHBOARD_DEFAULT_MONTHS} "
+        f"не підтримується (доступно: 1, 3, 6, 12), "
+        f"використано «{default_period}»"
+    )
+
+selected_period = st.sidebar.selectbox(
+    "Період даних:",
+    period_labels,
+    index=period_labels.index(default_period)
+)
+
+period_months = period_options[selected_period]
+period_caption = f"за {selected_period.lower()}"
+if period_months:
+    since = datetime.now(timezone.utc) - timedelta(days=30 * period_months)
+else:
+    since = None
+
 try:
-    total_items = run_sync(get_total_count())
+    total_items = run_sync(get_total_count(since))
 except Exception as e:
     st.error(f"Помилка підключення: {e}")
     total_items = 0
@@ -86,7 +132,7 @@ for i in range(total_pages):
     page_options.append(f"{start}-{end}")
 
 selected_range = st.sidebar.selectbox(
-    f"Сторінка (Всього авто: {total_items}):",
+    f"Сторінка (Авто {period_caption}: {total_items}):",
     page_options,
     index=0
 )
@@ -126,13 +172,13 @@ st.caption(f"Стан на: **{current_time_kyiv}** (Київ). "
 
 # --- ЗАВАНТАЖЕННЯ ДАНИХ ---
 try:
-    raw_chart_data = run_sync(get_chart_data())
+    raw_chart_data = run_sync(get_chart_data(since))
     df_global = pd.DataFrame(raw_chart_data, columns=['price_usd',
                                                       'odometer',
                                                       'title',
                                                       'datetime_found'])
 
-    table_data = run_sync(get_table_page(offset, PAGE_SIZE))
+    table_data = run_sync(get_table_page(offset, PAGE_SIZE, since))
     df_table = pd.DataFrame(table_data)
 
 except Exception as e:
@@ -141,11 +187,11 @@ except Exception as e:
     df_table = pd.DataFrame()
 
 # --- БЛОК: ГЛОБАЛЬНА СТАТИСТИКА ---
-st.markdown("### 📊 Глобальна статистика ринку")
+st.markdown(f"### 📊 Статистика ринку {period_caption}")
 if not df_global.empty:
     gm1, gm2, gm3, gm4 = st.columns(4)
 
-    gm1.metric("Всього зібрано", f"{len(df_global):,}")
+    gm1.metric(f"Зібрано {period_caption}", f"{len(df_global):,}")
     gm2.metric("Середня ціна", f"${df_global['price_usd'].mean():,.0f}")
     gm3.metric("Середній пробіг", f"{df_global['odometer'].mean():,.0f} км")
 
@@ -168,12 +214,12 @@ if not df_global.empty:
 
     c1, c2 = st.columns(2)
     with c1:
-        st.info("Топ марок (аналіз всієї бази)")
+        st.info(f"Топ марок ({period_caption})")
         st.bar_chart(df_global['Brand'].value_counts().head(15),
                      color="#FF4B4B")
 
     with c2:
-        st.info("Розподіл цін та пробігів (всі авто)")
+        st.info(f"Розподіл цін та пробігів ({period_caption})")
         st.scatter_chart(df_global,
                          x='odometer',
                          y='price_usd',
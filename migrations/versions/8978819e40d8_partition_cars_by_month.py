@@ -0,0 +1,120 @@
+"""partition cars by month
+
+Revision ID: 8978819e40d8
+Revises: f78aaef83dac
+Create Date: 2026-10-19 10:12:41.503117
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8978819e40d8'
+down_revision: Union[str, None] = 'f78aaef83dac'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONS_AHEAD = 2
+
+
+def _add_months(dt, months):
+    month_index = dt.year * 12 + dt.month - 1 + months
+    return datetime(month_index // 12, month_index % 12 + 1, 1,
+                    tzinfo=timezone.utc)
+
+
+def _create_partition(month):
+    end = _add_months(month, 1)
+    op.execute(
+        f"CREATE TABLE cars_y{month.year}m{month.month:02d} "
+        f"PARTITION OF cars "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def _car_columns():
+    return [
+        sa.Column('id', sa.Integer(), nullable=False,
+                  server_default=sa.text("nextval('cars_id_seq'::regclass)")),
+        sa.Column('url', sa.String(length=500), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('price_usd', sa.Integer(), nullable=False),
+        sa.Column('odometer', sa.Integer(), nullable=False),
+        sa.Column('username', sa.String(length=255), nullable=False),
+        sa.Column('phone_number', sa.BigInteger(), nullable=False),
+        sa.Column('image_url', sa.String(length=500), nullable=False),
+        sa.Column('images_count', sa.Integer(), nullable=False),
+        sa.Column('car_number', sa.String(length=20), nullable=False),
+        sa.Column('car_vin', sa.String(length=50), nullable=False),
+        sa.Column('datetime_found', sa.DateTime(timezone=True),
+                  nullable=False),
+    ]
+
+
+def _rename_to_old():
+    op.rename_table('cars', 'cars_old')
+    op.execute("ALTER SEQUENCE cars_id_seq OWNED BY NONE")
+    op.execute("ALTER TABLE cars_old "
+               "RENAME CONSTRAINT cars_pkey TO cars_old_pkey")
+
+
+def upgrade() -> None:
+    _rename_to_old()
+    op.execute("ALTER TABLE cars_old "
+               "RENAME CONSTRAINT cars_url_key TO cars_old_url_key")
+
+    op.create_table(
+        'cars',
+        *_car_columns(),
+        sa.PrimaryKeyConstraint('id', 'datetime_found'),
+        postgresql_partition_by='RANGE (datetime_found)',
+    )
+    op.execute("ALTER SEQUENCE cars_id_seq OWNED BY cars.id")
+    op.create_index('ix_cars_url', 'cars', ['url'])
+    op.create_index('ix_cars_datetime_found', 'cars', ['datetime_found'])
+
+    now = datetime.now(timezone.utc)
+    first_found = op.get_bind().execute(
+        sa.text("SELECT min(datetime_found) FROM cars_old")
+    ).scalar()
+    if first_found is not None:
+        first_found = first_found.astimezone(timezone.utc)
+    month = _add_months(first_found or now, 0)
+    last_month = _add_months(now, PARTITIONS_AHEAD)
+    while month <= last_month:
+        _create_partition(month)
+        month = _add_months(month, 1)
+    op.execute("CREATE TABLE cars_default PARTITION OF cars DEFAULT")
+
+    op.create_table(
+        'car_urls',
+        sa.Column('url', sa.String(length=500), nullable=False),
+        sa.Column('datetime_found', sa.DateTime(timezone=True),
+                  nullable=False),
+        sa.PrimaryKeyConstraint('url'),
+    )
+
+    op.execute("INSERT INTO cars SELECT * FROM cars_old")
+    op.execute("INSERT INTO car_urls (url, datetime_found) "
+               "SELECT url, datetime_found FROM cars_old")
+    op.drop_table('cars_old')
+
+
+def downgrade() -> None:
+    op.drop_table('car_urls')
+    _rename_to_old()
+
+    op.create_table(
+        'cars',
+        *_car_columns(),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('url'),
+    )
+    op.execute("ALTER SEQUENCE cars_id_seq OWNED BY cars.id")
+    op.execute("INSERT INTO cars SELECT * FROM cars_old "
+               "ON CONFLICT (url) DO NOTHING")
+    op.drop_table('cars_old')
@@ -0,0 +1,101 @@
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ("aiohttp", "bs4", "sqlalchemy", "alembic")
+
+IMPORTTIME_RE = re.compile(
+    r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)$"
+)
+
+# Everything src.scraper.main() loads before its first HTTP request:
+# lazy imports, the HTTP client, the models and the schema revision check,
+# which resolves the migrations head.
+STARTUP_CODE = """
+import time
+started = time.perf_counter()
+import src.scraper
+from bs4 import BeautifulSoup
+from src.database import get_head_revision
+from src.http_client import HttpClient
+from src.models import Car, CarUrl
+get_head_revision()
+print((time.perf_counter() - started) * 1000)
+"""
+
+
+def run_python(code):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Помилка запуску:\n{result.stderr}")
+    return result
+
+
+def top_level_imports(stderr):
+    imports = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match and len(match.group(3)) == 1:
+            imports.append((int(match.group(2)) / 1000, match.group(4)))
+    return imports
+
+
+def imported_packages(stderr):
+    packages = set()
+    for line in stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match:
+            packages.add(match.group(4).split(".")[0])
+    return packages
+
+
+def eager_heavy_modules(module):
+    result = run_python(f"import {module}")
+    loaded = imported_packages(result.stderr)
+    return sorted(loaded.intersection(HEAVY_MODULES))
+
+
+def measure_startup():
+    result = run_python(STARTUP_CODE)
+    return float(result.stdout.strip()), top_level_imports(result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Перевірка часу старту скрапера через -X importtime"
+    )
+    parser.add_argument("--budget-ms", type=float, default=800.0)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [measure_startup() for _ in range(args.runs)]
+    best_ms, imports = min(runs)
+    print(f"Старт до першого запиту: {best_ms:.1f} ms "
+          f"(бюджет {args.budget_ms:.0f} ms, {args.runs} запусків)")
+    for cumulative_ms, name in sorted(imports, reverse=True)[:args.top]:
+        print(f"  {cumulative_ms:8.1f} ms  {name}")
+
+    errors = []
+    if best_ms > args.budget_ms:
+        errors.append(f"Перевищено бюджет: {best_ms:.1f} ms")
+    eager = eager_heavy_modules("src.scraper")
+    if eager:
+        errors.append(f"src.scraper одразу імпортує важкі модулі: {eager}")
+
+    for error in errors:
+        print(error)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
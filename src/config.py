@@ -13,6 +13,20 @@ class Settings(BaseSettings):
     DB_PASS: str = os.getenv('DB_PASS')
     DB_NAME: str = os.getenv('DB_NAME')
 
+    CARS_PARTITIONS_AHEAD: int = os.getenv('CARS_PARTITIONS_AHEAD', 2)
+    CARS_RETENTION_MONTHS: int = os.getenv('CARS_RETENTION_MONTHS', 12)
+    DASHBOARD_DEFAULT_MONTHS: int = os.getenv('DASHBOARD_DEFAULT_MONTHS', 3)
+
+    HTTP_CONCURRENCY: int = os.getenv('HTTP_CONCURRENCY', 2)
+    HTTP_CONNECT_TIMEOUT: float = os.getenv('HTTP_CONNECT_TIMEOUT', 10)
+    HTTP_READ_TIMEOUT: float = os.getenv('HTTP_READ_TIMEOUT', 20)
+    HTTP_TOTAL_TIMEOUT: float = os.getenv('HTTP_TOTAL_TIMEOUT', 45)
+    HTTP_KEEPALIVE_TIMEOUT: float = os.getenv('HTTP_KEEPALIVE_TIMEOUT', 30)
+    HTTP_DNS_CACHE_TTL: int = os.getenv('HTTP_DNS_CACHE_TTL', 300)
+    HTTP_MAX_RETRIES: int = os.getenv('HTTP_MAX_RETRIES', 4)
+    HTTP_BACKOFF_BASE: float = os.getenv('HTTP_BACKOFF_BASE', 1)
+    HTTP_BACKOFF_MAX: float = os.getenv('HTTP_BACKOFF_MAX', 60)
+
     @property
     def DATABASE_URL_asyncpg(self):
         return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASS}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"  # noqa
@@ -1,3 +1,5 @@
+from functools import cache
+from pathlib import Path
 from typing import Annotated
 
 from sqlalchemy import String
@@ -6,13 +8,21 @@ from sqlalchemy.orm import DeclarativeBase
 
 from src.config import settings
 
+ROOT_DIR = Path(__file__).resolve().parent.parent
 
-async_engine = create_async_engine(
-    url=settings.DATABASE_URL_asyncpg,
-    echo=False,
-)
 
-async_session_factory = async_sessionmaker(async_engine)
+@cache
+def get_async_engine():
+    return create_async_engine(
+        url=settings.DATABASE_URL_asyncpg,
+        echo=False,
+    )
+
+
+@cache
+def get_session_factory():
+    return async_sessionmaker(get_async_engine())
+
 
 str_256 = Annotated[str, 256]
 
@@ -34,6 +44,25 @@ class Base(DeclarativeBase):
         return f"<{self.__class__.__name__} {', '.join(cols)}>"
 
 
-async def init_db():
-    async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+def get_head_revision():
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory(str(ROOT_DIR / "migrations")).get_current_head()
+
+
+def get_current_revision(conn):
+    from alembic.runtime.migration import MigrationContext
+
+    return MigrationContext.configure(conn).get_current_revision()
+
+
+async def check_schema():
+    async with get_async_engine().connect() as conn:
+        current = await conn.run_sync(get_current_revision)
+
+    head = get_head_revision()
+    if current != head:
+        raise RuntimeError(
+            f"Схема БД не актуальна: {current} != {head}. "
+            f"Виконайте 'alembic upgrade head'"
+        )
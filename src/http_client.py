@@ -0,0 +1,143 @@
+import asyncio
+import random
+import time
+from bisect import bisect_left
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import aiohttp
+
+from src.config import settings
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+ENDPOINT_TYPES = ("listing", "detail", "popUp")
+
+
+def parse_retry_after(value):
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class LatencyHistogram:
+    buckets = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def __str__(self):
+        if not self.count:
+            return "немає запитів"
+        labels = [f"<={b}s" for b in self.buckets] + [f">{self.buckets[-1]}s"]
+        bins = ", ".join(
+            f"{label}: {count}"
+            for label, count in zip(labels, self.counts) if count
+        )
+        return (f"n={self.count}, "
+                f"avg={self.total / self.count:.2f}s, {bins}")
+
+
+class HttpClient:
+    def __init__(self, headers=None, concurrency=None, max_retries=None):
+        self.headers = headers
+        self.concurrency = concurrency or settings.HTTP_CONCURRENCY
+        self.max_retries = (settings.HTTP_MAX_RETRIES
+                            if max_retries is None else max_retries)
+        self.limiter = asyncio.Semaphore(self.concurrency)
+        self.histograms = {
+            endpoint: LatencyHistogram() for endpoint in ENDPOINT_TYPES
+        }
+        self.session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency,
+            limit_per_host=self.concurrency,
+            use_dns_cache=True,
+            ttl_dns_cache=settings.HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=settings.HTTP_TOTAL_TIMEOUT,
+            sock_connect=settings.HTTP_CONNECT_TIMEOUT,
+            sock_read=settings.HTTP_READ_TIMEOUT,
+        )
+        self.session = aiohttp.ClientSession(
+            headers=self.headers,
+            connector=connector,
+            timeout=timeout,
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+        self.print_stats()
+
+    def print_stats(self):
+        for endpoint, histogram in self.histograms.items():
+            print(f"Латентність {endpoint}: {histogram}")
+
+    def backoff_delay(self, attempt, retry_after=None):
+        ceiling = min(settings.HTTP_BACKOFF_MAX,
+                      settings.HTTP_BACKOFF_BASE * 2 ** attempt)
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            return max(min(retry_after, settings.HTTP_BACKOFF_MAX), delay)
+        return delay
+
+    async def request(self, method, url, endpoint, **kwargs):
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            started = time.perf_counter()
+            try:
+                async with self.session.request(method, url,
+                                                **kwargs) as response:
+                    text = await response.text(encoding='utf-8',
+                                               errors='replace')
+                    if (response.status in RETRY_STATUSES
+                            and attempt < self.max_retries):
+                        retry_after = parse_retry_after(
+                            response.headers.get("Retry-After")
+                        )
+                        print(f"{endpoint} {response.status}, "
+                              f"повтор {attempt + 1}: {url}")
+                    else:
+                        response.raise_for_status()
+                        return text, response.headers
+            except (aiohttp.ClientConnectionError,
+                    asyncio.TimeoutError) as e:
+                if attempt == self.max_retries:
+                    raise
+                print(f"{endpoint} {type(e).__name__}, "
+                      f"повтор {attempt + 1}: {url}")
+            finally:
+                self.histograms[endpoint].observe(
+                    time.perf_counter() - started
+                )
+
+            await asyncio.sleep(self.backoff_delay(attempt, retry_after))
+
+    async def get(self, url, endpoint, **kwargs):
+        return await self.request("GET", url, endpoint, **kwargs)
+
+    async def post(self, url, endpoint, **kwargs):
+        return await self.request("POST", url, endpoint, **kwargs)
@@ -0,0 +1,101 @@
+import argparse
+import asyncio
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+
+from src.config import settings
+from src.database import check_schema, get_async_engine
+from src.partitions import (DEFAULT_PARTITION, add_months,
+                            archive_default_rows_sql, archive_partition_sql,
+                            attach_partition_sql, create_archive_schema_sql,
+                            create_default_archive_sql,
+                            create_default_partition_sql,
+                            create_partition_table_sql, delete_car_urls_sql,
+                            delete_default_rows_sql, detach_partition_sql,
+                            list_partitions_sql, month_start,
+                            months_between, move_default_rows_sql,
+                            partition_month, partition_name)
+
+
+async def ensure_partitions(conn, ahead):
+    await conn.execute(text(create_default_partition_sql()))
+    result = await conn.execute(text(list_partitions_sql()))
+    existing = set(result.scalars())
+
+    now = datetime.now(timezone.utc)
+    for month in months_between(now, add_months(now, ahead)):
+        if partition_name(month) in existing:
+            continue
+        # Rows that landed in the default partition for this month would
+        # make ATTACH fail, so move them into the new table first.
+        await conn.execute(text(create_partition_table_sql(month)))
+        moved = await conn.execute(
+            text(move_default_rows_sql(month)),
+            {"start": month, "end": add_months(month, 1)},
+        )
+        if moved.rowcount:
+            print(f"Перенесено з {DEFAULT_PARTITION} у "
+                  f"{partition_name(month)}: {moved.rowcount}")
+        await conn.execute(text(attach_partition_sql(month)))
+
+
+async def apply_retention(conn, keep_months, drop=False):
+    cutoff = add_months(month_start(datetime.now(timezone.utc)),
+                        -keep_months)
+    params = {"cutoff": cutoff}
+    result = await conn.execute(text(list_partitions_sql()))
+    if not drop:
+        await conn.execute(text(create_archive_schema_sql()))
+
+    detached = []
+    for name in sorted(result.scalars()):
+        month = partition_month(name)
+        if month is None or month >= cutoff:
+            continue
+        await conn.execute(text(detach_partition_sql(name)))
+        if drop:
+            await conn.execute(text(f"DROP TABLE {name}"))
+        else:
+            await conn.execute(text(archive_partition_sql(name)))
+        detached.append(name)
+
+    if drop:
+        await conn.execute(text(delete_default_rows_sql()), params)
+    else:
+        await conn.execute(text(create_default_archive_sql()))
+        await conn.execute(text(archive_default_rows_sql()), params)
+    await conn.execute(text(delete_car_urls_sql()), params)
+    return detached
+
+
+async def main(args):
+    await check_schema()
+    async_engine = get_async_engine()
+    async with async_engine.begin() as conn:
+        if args.command in ("partitions", "all"):
+            await ensure_partitions(conn, args.ahead)
+            print(f"Партиції створено на {args.ahead} міс. вперед")
+        if args.command in ("retention", "all"):
+            detached = await apply_retention(conn, args.keep_months,
+                                             args.drop)
+            print(f"Від'єднано партиції: {detached or 'немає'}")
+    await async_engine.dispose()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Обслуговування партицій таблиці cars"
+    )
+    parser.add_argument("command", choices=["partitions", "retention", "all"])
+    parser.add_argument("--ahead", type=int,
+                        default=settings.CARS_PARTITIONS_AHEAD)
+    parser.add_argument("--keep-months", type=int,
+                        default=settings.CARS_RETENTION_MONTHS)
+    parser.add_argument("--drop", action="store_true",
+                        help="Видаляти від'єднані партиції, а не архівувати")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
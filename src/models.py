@@ -9,9 +9,13 @@ from src.database import Base
 class Car(Base):
     __tablename__ = "cars"
 
-    id: Mapped[int] = mapped_column(primary_key=True)
+    __table_args__ = {
+        "postgresql_partition_by": "RANGE (datetime_found)",
+    }
 
-    url: Mapped[str] = mapped_column(String(500), unique=True, nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    url: Mapped[str] = mapped_column(String(500), index=True, nullable=False)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
 
     price_usd: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -30,5 +34,17 @@ class Car(Base):
     datetime_found: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=datetime.utcnow,
+        primary_key=True,
+        index=True,
+    )
+
+
+class CarUrl(Base):
+    __tablename__ = "car_urls"
+
+    url: Mapped[str] = mapped_column(String(500), primary_key=True)
+
+    datetime_found: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
         nullable=False,
     )
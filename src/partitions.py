@@ -0,0 +1,115 @@
+import re
+from datetime import datetime, timezone
+
+PARENT_TABLE = "cars"
+DEFAULT_PARTITION = "cars_default"
+ARCHIVE_SCHEMA = "archive"
+
+PARTITION_NAME_RE = re.compile(r"^cars_y(\d{4})m(\d{2})$")
+
+
+def month_start(dt):
+    return datetime(dt.year, dt.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(dt, months):
+    month_index = dt.year * 12 + dt.month - 1 + months
+    return datetime(month_index // 12, month_index % 12 + 1, 1,
+                    tzinfo=timezone.utc)
+
+
+def partition_name(dt):
+    return f"{PARENT_TABLE}_y{dt.year}m{dt.month:02d}"
+
+
+def partition_month(name):
+    match = PARTITION_NAME_RE.match(name)
+    if not match:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1,
+                    tzinfo=timezone.utc)
+
+
+def months_between(start, end):
+    current = month_start(start)
+    while current <= end:
+        yield current
+        current = add_months(current, 1)
+
+
+def create_partition_table_sql(month):
+    return (
+        f"CREATE TABLE {partition_name(month)} "
+        f"(LIKE {PARENT_TABLE} INCLUDING DEFAULTS)"
+    )
+
+
+def move_default_rows_sql(month):
+    return (
+        f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+        f"WHERE datetime_found >= :start AND datetime_found < :end "
+        f"RETURNING *) "
+        f"INSERT INTO {partition_name(month)} SELECT * FROM moved"
+    )
+
+
+def attach_partition_sql(month):
+    start = month_start(month)
+    end = add_months(start, 1)
+    return (
+        f"ALTER TABLE {PARENT_TABLE} "
+        f"ATTACH PARTITION {partition_name(start)} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def create_default_partition_sql():
+    return (
+        f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} "
+        f"PARTITION OF {PARENT_TABLE} DEFAULT"
+    )
+
+
+def detach_partition_sql(name):
+    return f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"
+
+
+def create_archive_schema_sql():
+    return f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"
+
+
+def archive_partition_sql(name):
+    return f"ALTER TABLE {name} SET SCHEMA {ARCHIVE_SCHEMA}"
+
+
+def create_default_archive_sql():
+    return (
+        f"CREATE TABLE IF NOT EXISTS {ARCHIVE_SCHEMA}.{DEFAULT_PARTITION} "
+        f"(LIKE {PARENT_TABLE})"
+    )
+
+
+def archive_default_rows_sql():
+    return (
+        f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+        f"WHERE datetime_found < :cutoff RETURNING *) "
+        f"INSERT INTO {ARCHIVE_SCHEMA}.{DEFAULT_PARTITION} "
+        f"SELECT * FROM moved"
+    )
+
+
+def delete_default_rows_sql():
+    return f"DELETE FROM {DEFAULT_PARTITION} WHERE datetime_found < :cutoff"
+
+
+def delete_car_urls_sql():
+    return "DELETE FROM car_urls WHERE datetime_found < :cutoff"
+
+
+def list_partitions_sql():
+    return (
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+        "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+        f"WHERE parent.relname = '{PARENT_TABLE}'"
+    )
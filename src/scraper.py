@@ -2,17 +2,9 @@ import asyncio
 import json
 import os
 import re
+from datetime import datetime
 
-import aiohttp
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
-import requests
-from sqlalchemy.dialects.postgresql import insert
-
-from src.database import async_session_factory, init_db
-from src.models import Car
-
-sem = asyncio.Semaphore(2)
 
 load_dotenv()
 
@@ -74,7 +66,7 @@ def get_user_phone_id(soup, car_url):
             return None
 
 
-def get_phone_number(soup, cookie, car_url):
+async def get_phone_number(client, soup, cookie, car_url):
     data = get_user_phone_id(soup, car_url)
 
     url = "https://auto.ria.com/bff/final-page/public/auto/popUp"
@@ -98,9 +90,9 @@ def get_phone_number(soup, cookie, car_url):
         "Cookie": cookie
     }
 
-    response = requests.request("POST", url, json=payload, headers=headers)
+    text, _ = await client.post(url, "popUp", json=payload, headers=headers)
     try:
-        data = json.loads(response.text)
+        data = json.loads(text)
 
         raw_phone = data.get("additionalParams", {}).get("phoneStr")
 
@@ -122,23 +114,42 @@ def get_phone_number(soup, cookie, car_url):
 
 
 async def save_cars_to_db(cars_data):
-    if not cars_data:
-        return
+    from sqlalchemy.dialects.postgresql import insert
 
-    async with async_session_factory() as session:
-        stmt = insert(Car).values(cars_data)
+    from src.database import get_session_factory
+    from src.models import Car, CarUrl
 
-        stmt = stmt.on_conflict_do_nothing(index_elements=['url'])
+    if not cars_data:
+        return
 
-        await session.execute(stmt)
+    now = datetime.utcnow()
+    cars_by_url = {}
+    for car in cars_data:
+        car.setdefault("datetime_found", now)
+        cars_by_url[car["url"]] = car
+
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        url_stmt = insert(CarUrl).values([
+            {"url": url, "datetime_found": car["datetime_found"]}
+            for url, car in cars_by_url.items()
+        ])
+        url_stmt = url_stmt.on_conflict_do_nothing(
+            index_elements=['url']
+        ).returning(CarUrl.url)
+
+        new_urls = (await session.execute(url_stmt)).scalars().all()
+        new_cars = [cars_by_url[url] for url in new_urls]
+
+        if new_cars:
+            await session.execute(insert(Car).values(new_cars))
         await session.commit()
-        print(f"Збережено нові записи: {len(cars_data)}")
+        print(f"Збережено нові записи: {len(new_cars)}")
 
 
-async def fetch_html(session, url):
-    async with session.get(url) as response:
-        response.raise_for_status()
-        return await response.text(encoding='utf-8', errors='replace')
+async def fetch_html(client, url, endpoint):
+    html, _ = await client.get(url, endpoint)
+    return html
 
 
 def parse_listing_page(soup):
@@ -154,13 +165,13 @@ def parse_listing_page(soup):
     return links
 
 
-async def fetch_car_details(session, car_url):
-    async with sem:
-        async with session.get(car_url) as response:
-            raw_cookie_header = response.headers.get("Set-Cookie")
-        html = await fetch_html(session, car_url)
+async def fetch_car_details(client, car_url):
+    from bs4 import BeautifulSoup
+
+    async with client.limiter:
+        html, response_headers = await client.get(car_url, "detail")
         soup = BeautifulSoup(html, "html.parser")
-        cookie = raw_cookie_header
+        cookie = response_headers.get("Set-Cookie")
 
         title = soup.select_one("#sideTitleTitle span").get_text()
         price_tag = soup.select_one("#sidePrice strong")
@@ -184,7 +195,8 @@ async def fetch_car_details(session, car_url):
             car_vin = car_warning_mvs.get_text().split()[-1]
         else:
             car_vin = "Відсутній"
-        phone_number = get_phone_number(soup, cookie, car_url)
+        phone_number = await get_phone_number(client, soup, cookie,
+                                              car_url)
         if not price_tag:
             price_tag = ""
         price_usd = clean_price(price_tag.get_text(strip=True))
@@ -213,9 +225,11 @@ async def fetch_car_details(session, car_url):
         return data
 
 
-async def parse_page(session, page):
+async def parse_page(client, page):
+    from bs4 import BeautifulSoup
+
     url = f"{BASE_URL}?page={page}"
-    html = await fetch_html(session, url)
+    html = await fetch_html(client, url, "listing")
     soup = BeautifulSoup(html, "html.parser")
 
     car_links = parse_listing_page(soup)
@@ -223,9 +237,13 @@ async def parse_page(session, page):
         print('car_links', car_links)
         return None, None
 
-    tasks = [fetch_car_details(session, link) for link in car_links]
-    results = await asyncio.gather(*tasks)
-    results = [r for r in results if r is not None]
+    tasks = [fetch_car_details(client, link) for link in car_links]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for link, result in zip(car_links, results):
+        if isinstance(result, BaseException):
+            print(f"Помилка {result!r}: {link}")
+    results = [r for r in results
+               if r is not None and not isinstance(r, BaseException)]
 
     next_btn = soup.select_one("a.js-next")
     has_next = next_btn and "disabled" not in next_btn.get("class", [])
@@ -234,13 +252,16 @@ async def parse_page(session, page):
 
 
 async def main():
-    await init_db()
+    from src.database import check_schema
+    from src.http_client import HttpClient
+
+    await check_schema()
     headers = {"User-Agent": "Mozilla/5.0"}
     page = 1
 
-    async with aiohttp.ClientSession(headers=headers) as session:
+    async with HttpClient(headers=headers) as client:
         while True:
-            results, has_next = await parse_page(session, page)
+            results, has_next = await parse_page(client, page)
 
             if results:
                 await save_cars_to_db(results)